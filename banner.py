@@ -14,9 +14,10 @@ Usage examples:
   python3 banner.py "VEX ROBOTICS" --cols 66 --lines 80 --rotate cw --preview
 """
 
-import math
 import subprocess
-from typing import Dict, Tuple, List
+import sys
+from functools import lru_cache
+from typing import Dict, Tuple, List, Sequence
 
 GLYPH_W = 5
 GLYPH_H = 7
@@ -24,6 +25,10 @@ GLYPH_H = 7
 MARGIN_DEFAULT = 5  # vertical top/bottom margin in lines
 SIDE_MARGIN_DEFAULT = 10  # horizontal left/right margin in columns (for width-fill)
 
+# A bitmap is a list of rows. Rows are built as plain strings (one byte per ASCII cell,
+# immutable so they can be shared), but lists of 1-char strings are accepted as well.
+Bitmap = Sequence[Sequence[str]]
+
 # 5x7 font: each tuple has 7 rows; each row is a 5-bit integer (bit 4 = leftmost).
 # Glyphs are blocky but readable when rotated.
 FONT_5X7: Dict[str, Tuple[int, int, int, int, int, int, int]] = {
@@ -73,26 +78,79 @@ FONT_5X7: Dict[str, Tuple[int, int, int, int, int, int, int]] = {
     ":": (0b00000,0b00110,0b00110,0b00000,0b00110,0b00110,0b00000),
 }
 
-def glyph_for(ch: str) -> Tuple[int, ...]:
-    return FONT_5X7.get(ch, FONT_5X7[" "])
+@lru_cache(maxsize=256)
+def _spaces(n: int) -> str:
+    """
+    Shared run of n spaces, reused for padding and blank lines across banners.
+    """
+    return " " * n
+
+def _pack_glyph(rows: Tuple[int, ...]) -> int:
+    """
+    Pack a glyph's 7 rows of 5 bits into a single 35-bit integer (top row in the high bits).
+    """
+    packed = 0
+    for row_bits in rows:
+        packed = (packed << GLYPH_W) | row_bits
+    return packed
+
+FONT_PACKED: Dict[str, int] = {ch: _pack_glyph(rows) for ch, rows in FONT_5X7.items()}
+
+def _glyph_rows(ch: str) -> Tuple[str, ...]:
+    """
+    Pre-render a glyph as GLYPH_H row strings, using the character itself as the pixel.
+    """
+    # Unpack all 35 bits at once, then map 0/1 to space/pixel and cut into rows
+    bits = format(FONT_PACKED.get(ch, 0), f"0{GLYPH_W * GLYPH_H}b")
+    pixels = bits.translate({ord("0"): " ", ord("1"): ch})
+    return tuple(pixels[i:i + GLYPH_W] for i in range(0, len(pixels), GLYPH_W))
+
+# Every glyph rendered once at import, so a banner is assembled a whole glyph row at a time.
+# Indexed by ord(ch) for ASCII; characters missing from the font map to a blank glyph.
+BLANK_GLYPH = _glyph_rows(" ")
+GLYPH_ROWS: List[Tuple[str, ...]] = [BLANK_GLYPH] * 128
+for _ch in FONT_5X7:
+    GLYPH_ROWS[ord(_ch)] = _glyph_rows(_ch)
+
+def _glyph_cols(rows: Tuple[str, ...], direction: str) -> Tuple[str, ...]:
+    """
+    Slice a pre-rendered glyph into the GLYPH_W lines it becomes after rotating,
+    in the order they are printed.
+    """
+    cols = ["".join(col) for col in zip(*rows)]  # transpose: each column top-to-bottom
+    if direction == "cw":
+        return tuple(col[::-1] for col in cols)  # left column first, read bottom-to-top
+    return tuple(reversed(cols))  # ccw: right column first, read top-to-bottom
+
+# Rotated glyph columns, indexed by ord(ch), so a banner can be emitted without rotating a bitmap
+BLANK_COLS = _glyph_cols(BLANK_GLYPH, "cw")
+GLYPH_COLS_CW: List[Tuple[str, ...]] = [_glyph_cols(rows, "cw") for rows in GLYPH_ROWS]
+GLYPH_COLS_CCW: List[Tuple[str, ...]] = [_glyph_cols(rows, "ccw") for rows in GLYPH_ROWS]
     
-def scale_bitmap(bitmap, zoom: int) -> List[List[str]]:
+def _zoom_factors(zoom: int) -> Tuple[int, int]:
     """
-    Nearest-neighbor scale: duplicate each pixel zoom times horizontally
-    and each row zoom times vertically.
+    Horizontal and vertical pixel repeat for a zoom level (width is 3/5 of height,
+    never rounded down to zero).
+    """
+    return max(1, zoom * 3 // 5), max(1, zoom)
+
+def scale_bitmap(bitmap: Bitmap, zoom: int) -> Bitmap:
+    """
+    Nearest-neighbor scale: duplicate each pixel 3/5 * zoom times horizontally
+    (printer characters are taller than they are wide) and each row zoom times
+    vertically. Scaled rows are returned as strings.
     """
     if zoom <= 1:
         return bitmap  # no scaling needed
 
-    scaled = []
+    xzoom, _ = _zoom_factors(zoom)
+    scaled: List[str] = []
     for row in bitmap:
-        new_row = []
-        for ch in row:
-            new_row.extend([ch] * int(zoom * (3/5)))  # widen pixels
-        for _ in range(zoom):
-            scaled.append(new_row[:])    # duplicate rows
+        new_row = "".join([ch * xzoom for ch in row])  # widen pixels
+        scaled.extend([new_row] * zoom)  # duplicate rows (strings are immutable, so share them)
     return scaled
 
+@lru_cache(maxsize=128)
 def compute_auto_zoom(text: str,
                       page_lines: int,
                       page_cols: int,
@@ -109,8 +167,7 @@ def compute_auto_zoom(text: str,
     The zoom is calculated to fit one letter's width (GLYPH_H=7) into the 
     available page width (page_cols), which becomes the vertical height after rotation.
     """
-    text = (text or "").upper()
-    if len(text) == 0:
+    if not text:
         return 1
 
     # Calculate zoom to fill the vertical space (page_cols becomes height after rotation)
@@ -123,38 +180,30 @@ def compute_auto_zoom(text: str,
     
     return zoom
 
-def render_line_to_bitmap(text: str, h_space: int = 1) -> List[List[str]]:
+def render_line_to_bitmap(text: str, h_space: int = 1) -> List[str]:
     """
     Build a 2D bitmap (rows=GLYPH_H, cols=total width) using the *character itself* as the pixel.
+    Each row is a single string, so cells are still addressed as bitmap[row][col].
     """
     text = text.upper()
-    cols = len(text) * (GLYPH_W + h_space) - (h_space if text else 0)
-    bitmap = [[" " for _ in range(cols)] for _ in range(GLYPH_H)]
-    x = 0
-    for ch in text:
-        bits = glyph_for(ch)
-        for row in range(GLYPH_H):
-            row_bits = bits[row]
-            for bit in range(GLYPH_W):
-                if row_bits & (1 << (GLYPH_W - 1 - bit)):
-                    bitmap[row][x + bit] = ch  # pixel uses the character itself
-        x += GLYPH_W + h_space
-    return bitmap
-
-def rotate_bitmap(bitmap: List[List[str]], direction: str = "cw") -> List[List[str]]:
+    glyphs = [GLYPH_ROWS[code] if code < 128 else BLANK_GLYPH for code in map(ord, text)]
+    gap = _spaces(h_space)
+    # Join whole glyph rows instead of setting pixels one at a time
+    return [gap.join(g[row] for g in glyphs) for row in range(GLYPH_H)]
+
+def rotate_bitmap(bitmap: Bitmap, direction: str = "cw") -> List[str]:
     """
     Rotate 90 degrees. After rotation:
       - width becomes original height (7)
       - height becomes original width (many lines)
+    Accepts rows as lists or strings; returns each rotated row as a string.
     """
-    rows = len(bitmap)
-    cols = len(bitmap[0]) if rows else 0
     if direction.lower() == "cw":
-        return [[bitmap[rows - 1 - r][c] for r in range(rows)] for c in range(cols)]
+        return ["".join(col) for col in zip(*reversed(bitmap))]
     # default ccw
-    return [[bitmap[r][cols - 1 - c] for r in range(rows)] for c in range(cols)]
+    return ["".join(col) for col in zip(*bitmap)][::-1]
 
-def center_on_pages(rot: List[List[str]],
+def center_on_pages(rot: Bitmap,
                     page_lines: int = 66,
                     page_cols: int = 80) -> List[str]:
     """
@@ -178,21 +227,90 @@ def center_on_pages(rot: List[List[str]],
 
     left_pad = (page_cols - rot_w) // 2
     right_pad = page_cols - rot_w - left_pad
-    line_pad_left = " " * left_pad
-    line_pad_right = " " * right_pad
+    line_pad_left = _spaces(left_pad)
+    line_pad_right = _spaces(right_pad)
 
     # Vertical centering to integer number of pages
-    pages = max(1, math.ceil(rot_h / page_lines))
+    pages = max(1, -(-rot_h // page_lines))  # ceiling division in integers
     total_lines = pages * page_lines
     top_pad = (total_lines - rot_h) // 2
     bottom_pad = total_lines - rot_h - top_pad
 
-    out: List[str] = []
-    out.extend([" " * page_cols] * top_pad)
-    for r in rot:
-        out.append(line_pad_left + "".join(r) + line_pad_right)
-    out.extend([" " * page_cols] * bottom_pad)
-    return out
+    # Build the centered block as one contiguous string with a single join (the
+    # padding between rows is the separator), then cut it into lines in one pass
+    blank = _spaces(page_cols)
+    body: List[str] = []
+    if rot_h:
+        rows = [r if isinstance(r, str) else "".join(r) for r in rot]
+        sep = line_pad_right + "\n" + line_pad_left
+        body = (line_pad_left + sep.join(rows) + line_pad_right).split("\n")
+    return [blank] * top_pad + body + [blank] * bottom_pad
+
+@lru_cache(maxsize=1024)
+def _glyph_stamp(ch: str, direction: str, zoom: int, page_cols: int) -> Tuple[str, ...]:
+    """
+    Final output lines for one glyph: rotated, scaled and centered on the page width.
+    Cached so each glyph is rasterized once per zoom level, then copied into every banner.
+    """
+    xzoom, yzoom = _zoom_factors(zoom)
+    rot_w = min(GLYPH_H * yzoom, page_cols)  # clip to the page if the scaled glyphs are too tall
+    left_pad = (page_cols - rot_w) // 2
+    line_pad_left = _spaces(left_pad)
+    line_pad_right = _spaces(page_cols - rot_w - left_pad)
+
+    code = ord(ch)
+    col_table = GLYPH_COLS_CW if direction == "cw" else GLYPH_COLS_CCW
+    cols = col_table[code] if code < 128 else BLANK_COLS
+    # Widen every pixel of a column with one C-level translate
+    widen = {ord(" "): _spaces(yzoom), code: ch * yzoom}
+    lines: List[str] = []
+    for pixels in cols:
+        if yzoom > 1:
+            pixels = pixels.translate(widen)
+        lines.extend([line_pad_left + pixels[:page_cols] + line_pad_right] * xzoom)
+    return tuple(lines)
+
+def _fused_lines(text: str,
+                 page_lines: int,
+                 page_cols: int,
+                 rotate: str,
+                 h_space: int,
+                 zoom: int) -> List[str]:
+    """
+    Single-pass equivalent of render -> scale -> rotate -> center, for text that is
+    already upper-cased.
+
+    After rotation each column of a glyph becomes one output line, so every glyph
+    is a fixed block of finished lines (see _glyph_stamp) and the banner is just
+    those blocks laid end to end. No intermediate bitmaps are materialized.
+
+    banner_lines renders through this function only. render_line_to_bitmap,
+    scale_bitmap, rotate_bitmap and center_on_pages are kept as the public
+    step-by-step reference and must produce the same lines (test_banner checks this).
+    """
+    xzoom, _ = _zoom_factors(zoom)
+    blank = _spaces(page_cols)
+
+    # CCW prints the text from its last character, so walk it backwards
+    if rotate.lower() == "cw":
+        direction, chars = "cw", text
+    else:
+        direction, chars = "ccw", text[::-1]
+
+    gap = [blank] * (h_space * xzoom)
+    body: List[str] = []
+    for i, ch in enumerate(chars):
+        if i:
+            body.extend(gap)
+        body.extend(_glyph_stamp(ch, direction, zoom, page_cols))
+
+    # Vertical centering to integer number of pages
+    rot_h = len(body)
+    pages = max(1, -(-rot_h // page_lines))  # ceiling division in integers
+    total_lines = pages * page_lines
+    top_pad = (total_lines - rot_h) // 2
+    bottom_pad = total_lines - rot_h - top_pad
+    return [blank] * top_pad + body + [blank] * bottom_pad
 
 def banner_lines(text: str,
                  page_lines: int = 66,      # Page height in lines
@@ -212,14 +330,15 @@ def banner_lines(text: str,
       - Prefer single-page height fit with top/bottom margin.
       - Else width-fill with left/right side margin.
     """
+    text = (text or "").upper()  # normalize once for everything below
     if zoom <= 0:
-        zoom = compute_auto_zoom(text, page_lines, page_cols, h_space,
-                                 margin_lines=margin, side_margin_cols=side_margin_cols)
+        if not text:
+            zoom = 1  # nothing to fit
+        else:
+            zoom = compute_auto_zoom(text, page_lines, page_cols, h_space,
+                                     margin_lines=margin, side_margin_cols=side_margin_cols)
 
-    bmp = render_line_to_bitmap(text, h_space=h_space)
-    bmp = scale_bitmap(bmp, zoom=zoom)
-    rot = rotate_bitmap(bmp, direction=rotate)
-    return center_on_pages(rot, page_lines=page_lines, page_cols=page_cols)
+    return _fused_lines(text, page_lines, page_cols, rotate, h_space, zoom)
 
 def send_to_lpr(lines: List[str], printer: str = None) -> None:
     """
@@ -230,10 +349,31 @@ def send_to_lpr(lines: List[str], printer: str = None) -> None:
         cmd += ["-P", printer]
     proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, encoding="utf-8")
     try:
-        proc.communicate("\n".join(lines) + "\n")
+        # Stream line by line and let the pipe apply backpressure,
+        # rather than joining the whole banner into one string first
+        write = proc.stdin.write
+        for line in lines:
+            write(line)
+            write("\n")
+    except BrokenPipeError:
+        pass  # lpr exited early
     finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
         proc.wait()
 
+def write_preview(lines: List[str], page_lines: int = 66, page_cols: int = 80) -> None:
+    """
+    Write the lines to stdout in one call, with a dashed rule between pages.
+    """
+    if not lines:
+        return
+    sep = "\n" + "-" * page_cols + "\n"
+    pages = ["\n".join(lines[i:i + page_lines]) for i in range(0, len(lines), page_lines)]
+    sys.stdout.write(sep.join(pages) + "\n")
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="Sideways ASCII banner -> lpr")
@@ -258,21 +398,25 @@ def main():
                          zoom=args.zoom,
                          margin=args.margin)
 
-    if args.preview:
-        for i, line in enumerate(lines, 1):
-            print(line)
-            if i % args.lines == 0 and i != len(lines):
-                print("-" * args.cols)
-    elif args.printer is not None:
+    if args.printer is not None:
         send_to_lpr(lines, printer=(args.printer or None))
     else:
-        # Default to preview if neither option specified
-        for i, line in enumerate(lines, 1):
-            print(line)
-            if i % args.lines == 0 and i != len(lines):
-                print("-" * args.cols)
+        # Preview (also the default if neither option specified)
+        write_preview(lines, page_lines=args.lines, page_cols=args.cols)
 
 def test_banner():
+    # The fused banner_lines must match the step-by-step reference pipeline for every
+    # glyph (plus lower case and characters missing from the font) at every zoom level
+    text = "".join(FONT_5X7) + "az#é"
+    for rotate in ("cw", "ccw"):
+        for h_space in (0, 1, 2):
+            for zoom in range(1, 13):
+                bitmap = scale_bitmap(render_line_to_bitmap(text, h_space), zoom)
+                expected = center_on_pages(rotate_bitmap(bitmap, rotate), page_lines=66, page_cols=80)
+                actual = banner_lines(text, page_lines=66, page_cols=80,
+                                      rotate=rotate, h_space=h_space, zoom=zoom)
+                assert actual == expected, f"{rotate=} {h_space=} {zoom=}"
+
     # 66 lines x 80 columns page, CW rotation
     # side_margin_cols=5 -> width-fill picks zoom=floor((80 - 10)/7)=10 -> 7*10 = 70
     lines = banner_lines("Happy Birthday Brian",
@@ -13,43 +13,66 @@ Layout:
 - Right panel: Scrollable banner preview
 """
 
+import bisect
+import collections
 import curses
+import curses.panel
 import csv
 import datetime
+import io
+import mmap
 import os
 import time
-from typing import List, Tuple, Optional
+from typing import List, NamedTuple, Tuple, Optional
 from banner import banner_lines, send_to_lpr
+from birthdays import parse_date
 
 DEFAULT_CSV = "birthdays.csv"
 DEFAULT_PRINTER = None  # Set to printer name (e.g., "lp0") or None for system default
+PREVIEW_CACHE_SIZE = 64  # Number of rendered banner previews to keep
+KEY_BATCH_MAX = 64  # Most queued keys applied before the screen is redrawn
+PREVIEW_DEBOUNCE_MS = 80  # Typing pause before the custom-text preview is regenerated
+CONTROLS = (  # Key help shown at the bottom of the left panel
+    "↑/↓    : Navigate birthdays",
+    "←/→    : Scroll preview H",
+    "PgUp/Dn: Scroll preview V",
+    "TAB    : Birthday/Custom",
+    "Ctrl+O : Open CSV file",
+    "Ctrl+P : Print banner",
+    "ESC    : Quit",
+)
+DIALOG_PAD_H, DIALOG_PAD_W = 24, 61  # Initial dialog pad size; it grows if a dialog needs more
+PAGE_BORDER = "+" + "-" * 80 + "+"  # Drawn between pages in the preview
+PREVIEW_ROW_W = 82  # Width of a preview row: 80 page columns plus a border on each side
+PREVIEW_BLANK_TRANS = str.maketrans("", "", " |")  # Deletes everything that isn't banner content
 
 class BirthdayEntry:
     """Represents a birthday entry from CSV"""
+    __slots__ = ("first_name", "alias", "dob", "display_name", "_str")
+    
     def __init__(self, first_name: str, alias: str, dob: datetime.date):
         self.first_name = first_name
         self.alias = alias
         self.dob = dob
         self.display_name = alias if alias else first_name
+        self._str = f"{self.display_name} ({self.dob.strftime('%B %d')})"
         
     def __str__(self):
-        return f"{self.display_name} ({self.dob.strftime('%B %d')})"
+        return self._str
 
-def parse_date(date_str: str) -> Optional[datetime.date]:
-    """Parse common date formats"""
-    date_str = date_str.strip()
-    fmts = [
-        "%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y",
-        "%B %d, %Y", "%b %d, %Y",
-        "%m-%d-%Y", "%m-%d-%y",
-    ]
-    for fmt in fmts:
-        try:
-            dt = datetime.datetime.strptime(date_str, fmt)
-            return dt.date()
-        except ValueError:
-            pass
-    return None
+class Layout(NamedTuple):
+    """Screen geometry, recomputed only when the terminal is resized"""
+    h: int  # Terminal size
+    w: int
+    left_w: int  # Panel widths
+    right_w: int
+    panel_h: int  # Both panels sit above the one-line message bar
+    preview_h: int  # Preview rows inside the right panel
+    preview_w: int
+    list_height: int  # Birthday list rows, below the header and above the controls
+    left_offset: int  # Column of the 82-wide page, beside the text indicator
+    display_width: int  # Visible columns of the page
+    max_h_scroll: int
 
 def load_birthdays(csv_file: str = DEFAULT_CSV) -> Tuple[List[BirthdayEntry], Optional[str]]:
     """Load birthdays from CSV file. Returns (birthdays, error_message)"""
@@ -59,41 +82,55 @@ def load_birthdays(csv_file: str = DEFAULT_CSV) -> Tuple[List[BirthdayEntry], Op
         return birthdays, f"File not found: {csv_file}"
         
     try:
-        with open(csv_file, newline='', encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            
-            # Check for required columns
-            if reader.fieldnames is None:
-                return birthdays, f"Empty or invalid CSV file: {csv_file}"
-            
-            # Create case-insensitive column mapping
-            col_map = {col.lower(): col for col in reader.fieldnames}
-            
-            # Check for required columns (case-insensitive)
-            if "first name" not in col_map and "date of birth" not in col_map:
-                return birthdays, f"Missing required columns: First Name, Date of Birth"
-            elif "first name" not in col_map:
-                return birthdays, f"Missing required column: First Name"
-            elif "date of birth" not in col_map:
-                return birthdays, f"Missing required column: Date of Birth"
-            
-            # Get actual column names
-            first_col = col_map["first name"]
-            dob_col = col_map["date of birth"]
-            alias_col = col_map.get("alias")
+        # Map the file and decode it in one go rather than through a buffered text reader
+        with open(csv_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    text = str(mm, "utf-8")
+                finally:
+                    mm.close()
+            else:
+                text = ""  # mmap can't map an empty file
+        
+        reader = csv.reader(io.StringIO(text, newline=""))
+        header = next(reader, None)
+        
+        # Check for required columns
+        if header is None:
+            return birthdays, f"Empty or invalid CSV file: {csv_file}"
+        
+        # Create case-insensitive column index mapping
+        col_map = {col.lower(): i for i, col in enumerate(header)}
+        
+        # Check for required columns (case-insensitive)
+        if "first name" not in col_map and "date of birth" not in col_map:
+            return birthdays, f"Missing required columns: First Name, Date of Birth"
+        elif "first name" not in col_map:
+            return birthdays, f"Missing required column: First Name"
+        elif "date of birth" not in col_map:
+            return birthdays, f"Missing required column: Date of Birth"
+        
+        # Get column positions
+        first_i = col_map["first name"]
+        dob_i = col_map["date of birth"]
+        alias_i = col_map.get("alias")
+        
+        for row in reader:
+            # Short rows (including blank lines) have no date of birth
+            if len(row) <= dob_i:
+                continue
+            first = row[first_i].strip() if first_i < len(row) else ""
+            alias = row[alias_i].strip() if alias_i is not None and alias_i < len(row) else ""
+            dob_str = row[dob_i].strip()
             
-            for row in reader:
-                first = row.get(first_col, "").strip()
-                alias = row.get(alias_col, "").strip() if alias_col else ""
-                dob_str = row.get(dob_col, "").strip()
+            if not dob_str:
+                continue
+                
+            dob = parse_date(dob_str)
+            if dob and (alias or first):
+                birthdays.append(BirthdayEntry(first, alias, dob))
                 
-                if not dob_str:
-                    continue
-                    
-                dob = parse_date(dob_str)
-                if dob and (alias or first):
-                    birthdays.append(BirthdayEntry(first, alias, dob))
-                    
         # Sort by month, then day
         birthdays.sort(key=lambda b: (b.dob.month, b.dob.day))
     except Exception as e:
@@ -101,23 +138,88 @@ def load_birthdays(csv_file: str = DEFAULT_CSV) -> Tuple[List[BirthdayEntry], Op
         
     return birthdays, None
 
+def render_preview(text: str) -> tuple:
+    """Render the preview for text. Returns (lines, rendered rows, page breaks, content start, content end)"""
+    lines = banner_lines(
+        text,
+        page_lines=66,
+        page_cols=80,
+        rotate="cw",
+        h_space=1,
+        zoom=0
+    )
+    
+    # One flag byte per row, set for page borders: every 66th line and the closing border after the last
+    page_break = bytearray(len(lines) + 1)
+    page_break[::66] = b"\x01" * len(range(0, len(page_break), 66))
+    page_break[-1] = 1
+    
+    # Find the first and last lines with actual content (not just border or spaces):
+    # blank out page borders, delete spaces and bars in one translate, and the
+    # surviving characters mark the content lines
+    joined = "\n".join("" if brk else line for line, brk in zip(lines, page_break))
+    stripped = joined.translate(PREVIEW_BLANK_TRANS)
+    first = len(stripped) - len(stripped.lstrip("\n"))
+    if first < len(stripped):
+        last = len(stripped.rstrip("\n")) - 1
+        content_start = stripped.count("\n", 0, first)
+        content_end = stripped.count("\n", 0, last)
+    else:
+        content_start = None
+        content_end = None
+    
+    # Pre-render every row exactly as drawn: borders baked in, padded to 80 columns,
+    # page breaks replaced by the page border, plus the closing border at the end.
+    # Rows are packed into one buffer with a fixed PREVIEW_ROW_W stride (banner pixels are ASCII)
+    rendered = [PAGE_BORDER if brk else "|" + line[:80].ljust(80) + "|"
+                for line, brk in zip(lines, page_break)]
+    rendered.append(PAGE_BORDER)
+    buf = "".join(rendered).encode("ascii", "replace")
+    
+    return lines, buf, page_break, content_start, content_end
+
 class BannerTUI:
     """Main TUI application for banner printing"""
     
     def __init__(self, stdscr, csv_file: str = DEFAULT_CSV):
         self.stdscr = stdscr
         self.csv_file = csv_file
+        self._dirty = {"left": True, "right": True, "msg": True}  # Which windows need redrawing
+        self._refresh_layout()
+        self._layout_stale = False  # Set when a dialog may have swallowed a resize
+        self.left_win = self.right_win = self.msg_win = None  # Panel windows, created by run()
+        self._panels = []  # curses panels holding left_win, right_win and msg_win, in that order
+        self._dialog_pad = curses.newpad(DIALOG_PAD_H, DIALOG_PAD_W)  # Shared by every dialog
+        self._dialog_pad.keypad(True)  # Enable keypad mode for special keys
+        self._dialog_pad.timeout(-1)  # Dialogs block on getch; nothing to do until a key arrives
+        self._dialog_size = None  # (height, width) of the frame currently drawn on the pad
+        self._dialog_rect = (0, 0, 0, 0)  # Where the pad is shown: (y, x, height, width)
         self.birthdays, load_error = load_birthdays(csv_file)
+        self._index_birthdays()
         if load_error:
             self.show_error_dialog(load_error)
         self.selected_idx = 0
         self.birthday_scroll = 0  # Scroll offset for birthday list
         self.birthday_visible_height = 15  # Will be updated dynamically
-        self.custom_text = ""
+        self._bday_row_cache = {}  # Panel width -> every unselected birthday list row, fitted to it
+        self._custom_buf = bytearray()  # Custom banner text as typed (printable ASCII only)
         self.mode = "birthday"  # "birthday" or "custom"
         self.preview_lines = []
+        self._preview_line_count = 0  # len(preview_lines), kept up to date wherever it's replaced
         self.preview_scroll = 0
         self.preview_h_scroll = 0  # Horizontal scroll offset
+        self.content_start_line = None  # First and last preview lines with banner content
+        self.content_end_line = None
+        self.text_indicator_scroll = 0  # Scroll offset of the vertical text indicator
+        self._indicator_chars = ""  # Indicator contents: the text between start/end markers, spaces shown as dots
+        self._preview_cache = collections.OrderedDict()  # LRU of rendered previews
+        self._preview_buf = b""  # Preview rows as drawn, PREVIEW_ROW_W bytes each, plus the closing border
+        self._preview_page_break = bytearray()  # One flag per row of _preview_buf: 1 for border rows
+        self._letter_starts = []  # See _get_letter_starts
+        self._letter_starts_key = None  # (content start, content end, letter count) it was built for
+        self._batching = False  # Applying a batch of queued keys: previews wait for the last one
+        self._preview_wanted = False  # update_preview was deferred (batch of keys, or typing)
+        self._typed_at = 0.0  # time.monotonic() of the last custom-text edit
         self.message = ""
         
         # Initialize curses settings
@@ -133,11 +235,65 @@ class BannerTUI:
         
         self.update_preview()
     
+    def _refresh_layout(self) -> Layout:
+        """Recompute the screen geometry from the terminal size"""
+        h, w = self.stdscr.getmaxyx()
+        left_w = min(40, w // 3)
+        right_w = w - left_w - 1
+        panel_h = h - 1
+        preview_h = panel_h - 4
+        preview_w = right_w - 4
+        
+        # The list starts below the title and mode header; controls need 9 rows if there's room
+        controls_height = 9 if panel_h >= 14 else 0
+        list_height = panel_h - 3 - controls_height - 2
+        
+        # Calculate centering offset for 82-char wide preview (80 chars + 2 borders),
+        # leaving 3 columns for the vertical text indicator
+        page_width = PREVIEW_ROW_W
+        available_preview_w = preview_w - 3
+        if available_preview_w >= page_width:
+            # Center the page in the available space
+            left_offset = 2 + (available_preview_w - page_width) // 2
+            display_width = page_width
+            max_h_scroll = 0
+        else:
+            # Window is too narrow, allow horizontal scrolling
+            left_offset = 2
+            display_width = available_preview_w
+            max_h_scroll = max(0, page_width - available_preview_w)
+        
+        self._layout = Layout(h, w, left_w, right_w, panel_h, preview_h, preview_w, list_height,
+                              left_offset, display_width, max_h_scroll)
+        return self._layout
+    
+    def _index_birthdays(self):
+        """Build the list labels for self.birthdays, parallel to it"""
+        self.bday_display_strs = [str(b) for b in self.birthdays]
+    
+    @staticmethod
+    def _fit_row(text: str, w: int) -> str:
+        """Truncate a birthday list row to fit a panel of width w"""
+        if len(text) > w - 3:
+            text = text[:w-6] + "..."
+        return text
+    
+    def _bday_rows(self, w: int) -> List[str]:
+        """Every birthday list row, unselected and fitted to width w (built once per width)"""
+        rows = self._bday_row_cache.get(w)
+        if rows is None:
+            self._bday_row_cache.clear()  # The old width is gone for good after a resize
+            rows = [self._fit_row(f"    {label}", w) for label in self.bday_display_strs]
+            self._bday_row_cache[w] = rows
+        return rows
+    
     def reload_csv(self, csv_file: str = None):
         """Reload birthdays from CSV file"""
         if csv_file:
             self.csv_file = csv_file
         self.birthdays, load_error = load_birthdays(self.csv_file)
+        self._index_birthdays()
+        self._bday_row_cache.clear()
         self.selected_idx = 0
         self.birthday_scroll = 0
         
@@ -148,21 +304,23 @@ class BannerTUI:
             self.message = f"Loaded {len(self.birthdays)} birthdays from {self.csv_file}"
         else:
             self.message = f"No birthdays found in {self.csv_file}"
+        self._dirty["left"] = self._dirty["msg"] = True
         self.update_preview()
     
     def prompt_for_file(self) -> Optional[str]:
         """Prompt user to enter a CSV filename"""
+        self._dirty.update(left=True, right=True, msg=True)
+        self._layout_stale = True
         # Save cursor state
         old_curs = curses.curs_set(1)  # Show cursor
         
-        h, w = self.stdscr.getmaxyx()
-        # Create a prompt window
-        prompt_win = curses.newwin(3, min(60, w - 4), h // 2 - 1, (w - min(60, w - 4)) // 2)
-        prompt_win.keypad(True)  # Enable keypad mode for special keys
-        prompt_win.box()
+        h, w = self._layout.h, self._layout.w
+        # Set up the prompt on the dialog pad
+        prompt_w = min(60, w - 4)
+        prompt_win = self._dialog(3, prompt_w, h // 2 - 1, (w - prompt_w) // 2)
         prompt_win.addstr(0, 2, " Open CSV File ", curses.color_pair(2) | curses.A_BOLD)
         prompt_win.addstr(1, 2, "File: ")
-        prompt_win.refresh()
+        self._refresh_dialog()
         
         # Input field
         input_str = self.csv_file
@@ -178,13 +336,11 @@ class BannerTUI:
             if len(input_str) >= 50:
                 display_cursor = min(cursor_pos - (len(input_str) - 47), 49)
             prompt_win.move(1, 8 + display_cursor)
-            prompt_win.refresh()
+            self._refresh_dialog()
             
             key = prompt_win.getch()
             
-            if key == -1:  # No input
-                continue
-            elif key == 27:  # ESC - cancel
+            if key == 27:  # ESC - cancel
                 curses.curs_set(old_curs)
                 return None
             elif key == ord('\n') or key == 10 or key == curses.KEY_ENTER:  # Enter - accept
@@ -211,7 +367,9 @@ class BannerTUI:
     
     def show_error_dialog(self, error_message: str):
         """Show an error dialog with the given message"""
-        h, w = self.stdscr.getmaxyx()
+        self._dirty.update(left=True, right=True, msg=True)
+        self._layout_stale = True
+        h, w = self._layout.h, self._layout.w
         
         # Wrap message to fit in dialog
         max_width = min(60, w - 8)
@@ -230,13 +388,12 @@ class BannerTUI:
         if current_line:
             lines.append(current_line)
         
-        # Create error window
+        # Set up the error dialog on the dialog pad
         dialog_height = min(len(lines) + 4, h - 4)
         dialog_width = min(max_width, w - 4)
-        dialog_win = curses.newwin(dialog_height, dialog_width, 
-                                   (h - dialog_height) // 2, 
-                                   (w - dialog_width) // 2)
-        dialog_win.box()
+        dialog_win = self._dialog(dialog_height, dialog_width,
+                                  (h - dialog_height) // 2,
+                                  (w - dialog_width) // 2)
         dialog_win.addstr(0, 2, " Error ", curses.color_pair(3) | curses.A_BOLD)
         
         # Display message lines
@@ -247,11 +404,53 @@ class BannerTUI:
         prompt = "Press any key to continue"
         dialog_win.addstr(dialog_height - 2, (dialog_width - len(prompt)) // 2, 
                          prompt, curses.A_DIM)
-        dialog_win.refresh()
+        self._refresh_dialog()
         
         # Wait for keypress
         dialog_win.getch()
         
+    def _dialog(self, dh: int, dw: int, y: int, x: int):
+        """Prepare a blank dh x dw framed dialog on the shared pad, to be shown at (y, x)"""
+        pad = self._dialog_pad
+        pad_h, pad_w = pad.getmaxyx()
+        if dh >= pad_h or dw > pad_w:
+            # Keep a spare row so the frame's lower-right corner never hits the pad's last cell
+            pad.resize(max(pad_h, dh + 1), max(pad_w, dw))
+            self._dialog_size = None
+        
+        if self._dialog_size != (dh, dw):
+            # Draw the frame only when the dialog size changes
+            pad.erase()
+            pad.vline(1, 0, curses.ACS_VLINE, dh - 2)
+            pad.vline(1, dw - 1, curses.ACS_VLINE, dh - 2)
+            pad.addch(dh - 1, 0, curses.ACS_LLCORNER)
+            pad.hline(dh - 1, 1, curses.ACS_HLINE, dw - 2)
+            pad.addch(dh - 1, dw - 1, curses.ACS_LRCORNER)
+            self._dialog_size = (dh, dw)
+        else:
+            # Same frame: just blank the interior
+            blank = " " * (dw - 2)
+            for row in range(1, dh - 1):
+                pad.addstr(row, 1, blank)
+        
+        # The top edge is redrawn every time since each dialog writes its title over it
+        pad.addch(0, 0, curses.ACS_ULCORNER)
+        pad.hline(0, 1, curses.ACS_HLINE, dw - 2)
+        pad.addch(0, dw - 1, curses.ACS_URCORNER)
+        
+        self._dialog_rect = (y, x, dh, dw)
+        return pad
+    
+    def _refresh_dialog(self):
+        """Copy the current dialog from the pad to the screen"""
+        y, x, dh, dw = self._dialog_rect
+        self._dialog_pad.refresh(0, 0, y, x, y + dh - 1, x + dw - 1)
+    
+    @property
+    def custom_text(self) -> str:
+        """The custom banner text typed so far"""
+        return self._custom_buf.decode("ascii")
+    
     def get_current_text(self) -> str:
         """Get the current text to preview/print"""
         if self.mode == "custom":
@@ -263,45 +462,72 @@ class BannerTUI:
         
     def update_preview(self):
         """Generate banner preview for current selection"""
+        if self._batching:
+            # Several keys are being applied at once: only the final selection needs a preview
+            self._preview_wanted = True
+            self._dirty["right"] = True
+            return
+        self._preview_wanted = False
+        self._dirty["right"] = True
         text = self.get_current_text()
+        self._indicator_chars = "▼" + text.replace(" ", "·") + "▲"
         if text:
-            self.preview_lines = banner_lines(
-                text,
-                page_lines=66,
-                page_cols=80,
-                rotate="cw",
-                h_space=1,
-                zoom=0
-            )
-            # Auto-scroll to show the first letter (find first non-space character)
-            self.preview_scroll = 0
-            self.preview_h_scroll = 0
-            
-            # Find the first and last lines with actual content (not just border or spaces)
-            self.content_start_line = None
-            self.content_end_line = None
-            
-            for i, line in enumerate(self.preview_lines):
-                # Skip page borders
-                if i % 66 == 0:
-                    continue
-                # Check if line has any non-space characters in the middle (not just borders)
-                content = line.strip('| ')
-                if content:
-                    if self.content_start_line is None:
-                        self.content_start_line = i
-                        # Scroll to show it with a bit of context above
-                        self.preview_scroll = max(0, i - 5)
-                    self.content_end_line = i
+            key = (text, 66, 80, "cw", 1, 0)  # (text, page_lines, page_cols, rotate, h_space, zoom)
+            cached = self._preview_cache.get(key)
+            if cached is not None:
+                # Revisiting a banner: reuse the rendered lines and content range
+                self._preview_cache.move_to_end(key)
+            else:
+                cached = render_preview(text)
+                self._preview_cache[key] = cached
+                if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                    self._preview_cache.popitem(last=False)  # evict least recently used
+            self._install_preview(cached)
         else:
             self.preview_lines = []
+            self._preview_line_count = 0
+            self._preview_buf = b""
+            self._preview_page_break = bytearray()
             self.preview_scroll = 0
             self.preview_h_scroll = 0
             self.content_start_line = None
             self.content_end_line = None
+    
+    def _defer_preview(self):
+        """Regenerate the preview once typing pauses, rather than on every keystroke"""
+        self._preview_wanted = True
+        self._typed_at = time.monotonic()
+    
+    def _debounce_ms(self) -> int:
+        """Milliseconds left before a deferred preview is due (0 if it's due now or none is wanted)"""
+        if not self._preview_wanted:
+            return 0
+        elapsed_ms = (time.monotonic() - self._typed_at) * 1000
+        return max(0, int(PREVIEW_DEBOUNCE_MS - elapsed_ms))
+    
+    def _flush_preview(self):
+        """Run an update_preview that was deferred while applying a batch of keys"""
+        if self._preview_wanted:
+            batching, self._batching = self._batching, False
+            self.update_preview()
+            self._batching = batching
+    
+    def _install_preview(self, preview: tuple):
+        """Show a rendered preview, scrolled to its first letter"""
+        (self.preview_lines, self._preview_buf, self._preview_page_break,
+         self.content_start_line, self.content_end_line) = preview
+        self._preview_line_count = len(self.preview_lines)
+        
+        # Auto-scroll to show the first letter, with a bit of context above
+        self.preview_h_scroll = 0
+        if self.content_start_line is not None:
+            self.preview_scroll = max(0, self.content_start_line - 5)
+        else:
+            self.preview_scroll = 0
         
-    def draw_left_panel(self, win, h: int, w: int):
+    def draw_left_panel(self, win, layout: Layout):
         """Draw the left panel with birthday list and custom input"""
+        h, w = layout.panel_h, layout.left_w
         win.erase()
         win.box()
         
@@ -323,31 +549,32 @@ class BannerTUI:
         
         if self.mode == "birthday" and self.birthdays:
             list_start_y = y
-            # Calculate list height based on whether controls are shown
-            controls_height = 9 if h >= 14 else 0
-            list_height = h - y - controls_height - 2  # Available space for list
+            list_height = layout.list_height
             self.birthday_visible_height = list_height  # Store for scroll calculations
             
-            # Show scrollable birthday list
+            # Show scrollable birthday list, all in the normal attribute
+            rows = self._bday_rows(w)
+            selected_y = None
             for i in range(self.birthday_scroll, min(len(self.birthdays), self.birthday_scroll + list_height)):
                 if h >= 14 and y >= h - 9:
                     break
                 elif h < 14 and y >= h - 2:
                     break
                     
-                bday = self.birthdays[i]
-                prefix = "  → " if i == self.selected_idx and self.mode == "birthday" else "    "
-                text = f"{prefix}{bday}"
-                
-                if len(text) > w - 3:
-                    text = text[:w-6] + "..."
-                    
-                attr = curses.color_pair(1) if i == self.selected_idx and self.mode == "birthday" else curses.A_NORMAL
+                if i == self.selected_idx:
+                    text = self._fit_row(f"  → {self.bday_display_strs[i]}", w)
+                    selected_y, selected_len = y, len(text)
+                else:
+                    text = rows[i]
                 try:
-                    win.addstr(y, 2, text, attr)
+                    win.addstr(y, 2, text)
                 except curses.error:
                     pass
                 y += 1
+            
+            # Then highlight just the selected row
+            if selected_y is not None:
+                win.chgat(selected_y, 2, selected_len, curses.color_pair(1))
                 
             # Show scroll indicator if needed
             if len(self.birthdays) > list_height:
@@ -382,35 +609,38 @@ class BannerTUI:
         
         # Instructions - only show if there's enough space (at least 14 lines from bottom)
         if h >= 14:
-            y = h - 9
-            win.addstr(y, 2, "Controls:", curses.color_pair(3) | curses.A_BOLD)
-            y += 1
-            win.addstr(y, 2, "↑/↓    : Navigate birthdays")
-            y += 1
-            win.addstr(y, 2, "←/→    : Scroll preview H")
-            y += 1
-            win.addstr(y, 2, "PgUp/Dn: Scroll preview V")
-            y += 1
-            win.addstr(y, 2, "TAB    : Birthday/Custom")
-            y += 1
-            win.addstr(y, 2, "Ctrl+O : Open CSV file")
-            y += 1
-            win.addstr(y, 2, "Ctrl+P : Print banner")
-            y += 1
-            win.addstr(y, 2, "ESC    : Quit")
+            win.addstr(h - 9, 2, "Controls:", curses.color_pair(3) | curses.A_BOLD)
+            for i, line in enumerate(CONTROLS):
+                win.addstr(h - 8 + i, 2, line)
         
-        win.refresh()
-        
-    def draw_right_panel(self, win, h: int, w: int):
+    def draw_right_panel(self, win, layout: Layout):
         """Draw the right panel with banner preview"""
+        h, w = layout.panel_h, layout.right_w
+        preview_h = layout.preview_h
+        current_text = self.get_current_text()
+        
+        # Reserve space for vertical text indicator if we have text
+        text_indicator_width = 3 if current_text else 0
+        
+        if self.preview_lines:
+            # Show scrollable preview with page borders
+            # Add 1 to max_scroll to allow showing final border
+            max_scroll = max(0, self._preview_line_count - preview_h + 1)
+            self.preview_scroll = min(self.preview_scroll, max_scroll)
+            
+            # The layout centers the page, or allows horizontal scrolling if it's too narrow
+            left_offset = layout.left_offset
+            display_width = layout.display_width
+            max_h_scroll = layout.max_h_scroll
+            self.preview_h_scroll = max(0, min(self.preview_h_scroll, max_h_scroll))
+        
         win.erase()
         win.box()
         
         # Header with current text
-        current_text = self.get_current_text()
         if current_text:
             # Calculate number of pages
-            num_pages = (len(self.preview_lines) + 65) // 66 if hasattr(self, 'preview_lines') and self.preview_lines else 0
+            num_pages = (self._preview_line_count + 65) // 66
             if num_pages > 0:
                 title = f" {current_text} - {num_pages} page{'s' if num_pages != 1 else ''} "
             else:
@@ -421,212 +651,177 @@ class BannerTUI:
             title = " Banner Preview "
         win.addstr(0, (w - len(title)) // 2, title, curses.color_pair(2) | curses.A_BOLD)
         
-        # Preview area
-        preview_h = h - 4
-        preview_w = w - 4
-        
-        # Reserve space for vertical text indicator if we have text
-        text_indicator_width = 3 if current_text else 0
-        available_preview_w = preview_w - text_indicator_width
-        
         if self.preview_lines:
-            # Show scrollable preview with page borders
-            # Add 1 to max_scroll to allow showing final border
-            max_scroll = max(0, len(self.preview_lines) - preview_h + 1)
-            self.preview_scroll = min(self.preview_scroll, max_scroll)
-            
-            # Calculate centering offset for 82-char wide preview (80 chars + 2 borders)
-            page_width = 82
-            if available_preview_w >= page_width:
-                # Center the page in the available space
-                left_offset = 2 + (available_preview_w - page_width) // 2
-                display_width = page_width
-                self.preview_h_scroll = 0  # No horizontal scroll needed
-                max_h_scroll = 0
+            if self.preview_h_scroll == 0 and display_width == PREVIEW_ROW_W:
+                # The whole page fits: skip the per-row slicing and border checks
+                self._draw_preview_fast(win, preview_h, left_offset)
             else:
-                # Window is too narrow, allow horizontal scrolling
-                left_offset = 2
-                display_width = available_preview_w
-                max_h_scroll = max(0, page_width - available_preview_w)
-                self.preview_h_scroll = min(self.preview_h_scroll, max_h_scroll)
-                self.preview_h_scroll = max(0, self.preview_h_scroll)
-            
-            for i in range(preview_h):
-                line_idx = self.preview_scroll + i
-                
-                # Check if we're at the end and should show the final border
-                if line_idx == len(self.preview_lines):
-                    # Show final closing border
-                    border = "+" + "-" * 80 + "+"
-                    border = border[self.preview_h_scroll:self.preview_h_scroll + display_width]
-                    try:
-                        win.addstr(2 + i, left_offset, border, curses.color_pair(5))
-                    except curses.error:
-                        pass
-                    continue
-                
-                if line_idx < len(self.preview_lines):
-                    # Check if this is a page boundary (every 66 lines)
-                    # Show border at start of first page and between pages
-                    is_page_break = (line_idx % 66) == 0
-                    
-                    line = self.preview_lines[line_idx]
-                    
-                    # Draw page border at breaks
-                    if is_page_break:
-                        border = "+" + "-" * 80 + "+"
-                        # Apply horizontal scroll if needed
-                        border = border[self.preview_h_scroll:self.preview_h_scroll + display_width]
-                        try:
-                            win.addstr(2 + i, left_offset, border, curses.color_pair(5))
-                        except curses.error:
-                            pass
-                        continue
-                    
-                    # Draw content line with left and right borders
-                    content = line[:80] if len(line) >= 80 else (line + " " * (80 - len(line)))
-                    display_line = "|" + content + "|"
-                    
-                    # Apply horizontal scroll if needed
-                    display_line = display_line[self.preview_h_scroll:self.preview_h_scroll + display_width]
-                    
-                    # Draw with color_pair(5) for the borders
-                    try:
-                        # Draw left border if visible
-                        if self.preview_h_scroll == 0:
-                            win.addstr(2 + i, left_offset, "|", curses.color_pair(5))
-                            win.addstr(2 + i, left_offset + 1, display_line[1:])
-                        else:
-                            win.addstr(2 + i, left_offset, display_line)
-                        
-                        # Draw right border if visible
-                        if self.preview_h_scroll + display_width >= 82:
-                            # Calculate position of the right border
-                            right_pos = left_offset + min(display_width - 1, len(display_line) - 1)
-                            win.addstr(2 + i, right_pos, "|", curses.color_pair(5))
-                    except curses.error:
-                        pass
+                for i in range(preview_h):
+                    self._render_preview_row(win, i, self.preview_scroll + i, left_offset, display_width)
             
             # Draw vertical text indicator on the right
-            if current_text and text_indicator_width > 0 and hasattr(self, 'content_start_line') and self.content_start_line is not None:
-                # Add visual markers for beginning and end of text
-                display_text = "▼" + current_text + "▲"
-                
-                # Calculate which letters are visible based on scroll position
-                # Only count the actual content lines, not the padding
-                content_height = self.content_end_line - self.content_start_line + 1 if self.content_end_line else 0
-                # Account for the added markers in the calculation
-                lines_per_letter = content_height / len(current_text) if len(current_text) > 0 and content_height > 0 else 0
-                
-                indicator_x = w - text_indicator_width
-                
-                # Determine visible letter range based on actual content
-                first_visible_line = max(self.preview_scroll, self.content_start_line)
-                last_visible_line = min(self.preview_scroll + preview_h - 1, self.content_end_line)
-                
-                # Calculate which letters are visible (in the original text, not including markers)
-                if lines_per_letter > 0 and first_visible_line >= self.content_start_line:
-                    first_visible_letter = int((first_visible_line - self.content_start_line) / lines_per_letter)
-                    last_visible_letter = min(int((last_visible_line - self.content_start_line) / lines_per_letter), len(current_text) - 1)
-                    
-                    # Check if we're showing padding before content (highlight start marker)
-                    if self.preview_scroll < self.content_start_line:
-                        # We're in the padding before content, highlight the start marker
-                        first_visible_display = 0
-                        last_visible_display = 0
-                    # Check if we're showing padding after content (highlight end marker)
-                    elif self.preview_scroll > self.content_end_line:
-                        # We're in the padding after content, highlight the end marker
-                        first_visible_display = len(display_text) - 1
-                        last_visible_display = len(display_text) - 1
-                    else:
-                        # Normal content viewing - adjust for the marker at the beginning
-                        first_visible_display = first_visible_letter + 1  # +1 for the ▼ marker
-                        last_visible_display = last_visible_letter + 1
+            self._draw_text_indicator(win, h, w, current_text, preview_h, text_indicator_width)
+            
+            # Scroll indicators
+            self._draw_scroll_info(win, h, w, preview_h, max_h_scroll)
+        else:
+            msg = "No preview available"
+            win.addstr(h // 2, (w - len(msg)) // 2, msg, curses.A_DIM)
+    
+    def _draw_preview_fast(self, win, preview_h: int, left_offset: int):
+        """Draw every visible preview row when the full 82-column page is on screen"""
+        border = curses.color_pair(5)
+        right = left_offset + PREVIEW_ROW_W - 1
+        start = self.preview_scroll
+        # Decode the visible block once, then cut it into rows at the fixed stride
+        block = str(memoryview(self._preview_buf)[start * PREVIEW_ROW_W:(start + preview_h) * PREVIEW_ROW_W], "ascii")
+        breaks = self._preview_page_break[start:start + preview_h]
+        for y, is_break in enumerate(breaks, 2):
+            row = block[(y - 2) * PREVIEW_ROW_W:(y - 1) * PREVIEW_ROW_W]
+            try:
+                if is_break:
+                    win.addstr(y, left_offset, row, border)
                 else:
-                    first_visible_display = -1
-                    last_visible_display = -1
-                
-                # Calculate vertical scroll for the text indicator
-                # Make sure the first highlighted character is visible
-                available_indicator_height = h - 4  # Space available for letters
+                    win.addstr(y, left_offset, row)
+                    win.chgat(y, left_offset, 1, border)
+                    win.chgat(y, right, 1, border)
+            except curses.error:
+                pass
+    
+    def _render_preview_row(self, win, i: int, line_idx: int, left_offset: int, display_width: int):
+        """Draw one preview line (or page border) at preview row i"""
+        if line_idx >= len(self._preview_page_break):
+            return
+        
+        # One addstr per row, sliced from the pre-rendered buffer with horizontal scroll applied
+        row_start = line_idx * PREVIEW_ROW_W
+        start = row_start + self.preview_h_scroll
+        end = min(row_start + PREVIEW_ROW_W, start + display_width)
+        row = str(memoryview(self._preview_buf)[start:end], "ascii") if end > start else ""
+        try:
+            if self._preview_page_break[line_idx]:
+                win.addstr(2 + i, left_offset, row, curses.color_pair(5))
+                return
+            
+            win.addstr(2 + i, left_offset, row)
+            if row:
+                # Color the left and right borders if they are visible
+                if self.preview_h_scroll == 0:
+                    win.chgat(2 + i, left_offset, 1, curses.color_pair(5))
+                if self.preview_h_scroll + display_width >= PREVIEW_ROW_W:
+                    win.chgat(2 + i, left_offset + len(row) - 1, 1, curses.color_pair(5))
+        except curses.error:
+            pass
+    
+    def _draw_text_indicator(self, win, h: int, w: int, current_text: str, preview_h: int,
+                             text_indicator_width: int):
+        """Draw the vertical text indicator showing which letters are in view"""
+        if current_text and text_indicator_width > 0 and self.content_start_line is not None:
+            # The text with visual markers for beginning and end, built by update_preview
+            display_text = self._indicator_chars
+            
+            # Calculate which letters are visible based on scroll position
+            # Only count the actual content lines, not the padding
+            content_height = self.content_end_line - self.content_start_line + 1 if self.content_end_line else 0
+            letter_starts = self._get_letter_starts(len(current_text)) if content_height > 0 else None
+            
+            indicator_x = w - text_indicator_width
+            
+            # Determine visible letter range based on actual content
+            first_visible_line = max(self.preview_scroll, self.content_start_line)
+            last_visible_line = min(self.preview_scroll + preview_h - 1, self.content_end_line)
+            
+            # Calculate which letters are visible (in the original text, not including markers)
+            if letter_starts and first_visible_line >= self.content_start_line:
+                first_visible_letter = bisect.bisect_right(letter_starts, first_visible_line) - 1
+                last_visible_letter = min(bisect.bisect_right(letter_starts, last_visible_line) - 1, len(current_text) - 1)
                 
-                if first_visible_display >= 0:
-                    # Initialize or maintain text indicator scroll offset
-                    if not hasattr(self, 'text_indicator_scroll'):
-                        self.text_indicator_scroll = 0
-                    
-                    # Auto-scroll to keep highlighted letters visible
-                    if first_visible_display < self.text_indicator_scroll:
-                        # Scroll up to show first highlighted character
-                        self.text_indicator_scroll = first_visible_display
-                    elif first_visible_display >= self.text_indicator_scroll + available_indicator_height:
-                        # Scroll down to show first highlighted character
-                        self.text_indicator_scroll = first_visible_display - available_indicator_height + 1
-                    
-                    # Also check if last highlighted character is visible
-                    if last_visible_display >= self.text_indicator_scroll + available_indicator_height:
-                        # Scroll to show last highlighted character with some context
-                        self.text_indicator_scroll = max(0, last_visible_display - available_indicator_height + 1)
-                    
-                    # Clamp scroll to valid range
-                    max_scroll = max(0, len(display_text) - available_indicator_height)
-                    self.text_indicator_scroll = max(0, min(self.text_indicator_scroll, max_scroll))
+                # Check if we're showing padding before content (highlight start marker)
+                if self.preview_scroll < self.content_start_line:
+                    # We're in the padding before content, highlight the start marker
+                    first_visible_display = 0
+                    last_visible_display = 0
+                # Check if we're showing padding after content (highlight end marker)
+                elif self.preview_scroll > self.content_end_line:
+                    # We're in the padding after content, highlight the end marker
+                    first_visible_display = len(display_text) - 1
+                    last_visible_display = len(display_text) - 1
                 else:
-                    if not hasattr(self, 'text_indicator_scroll'):
-                        self.text_indicator_scroll = 0
+                    # Normal content viewing - adjust for the marker at the beginning
+                    first_visible_display = first_visible_letter + 1  # +1 for the ▼ marker
+                    last_visible_display = last_visible_letter + 1
+            else:
+                first_visible_display = -1
+                last_visible_display = -1
+            
+            # Calculate vertical scroll for the text indicator
+            # Make sure the first highlighted character is visible
+            available_indicator_height = h - 4  # Space available for letters
+            
+            if first_visible_display >= 0:
+                # Auto-scroll to keep highlighted letters visible
+                if first_visible_display < self.text_indicator_scroll:
+                    # Scroll up to show first highlighted character
+                    self.text_indicator_scroll = first_visible_display
+                elif first_visible_display >= self.text_indicator_scroll + available_indicator_height:
+                    # Scroll down to show first highlighted character
+                    self.text_indicator_scroll = first_visible_display - available_indicator_height + 1
                 
-                # Draw each letter of the display text vertically, one per line
-                start_y = 2
-                for char_idx, char in enumerate(display_text):
-                    # Skip letters that are scrolled out of view
-                    display_idx = char_idx - self.text_indicator_scroll
-                    if display_idx < 0 or display_idx >= available_indicator_height:
-                        continue
-                    
-                    # Replace spaces with a visible character
-                    display_char = "·" if char == " " else char
-                    
-                    # Determine highlighting
-                    is_highlighted = first_visible_display <= char_idx <= last_visible_display
-                    is_marker = char_idx == 0 or char_idx == len(display_text) - 1
-                    
-                    if is_highlighted:
-                        attr = curses.color_pair(4) | curses.A_BOLD
-                    elif is_marker:
-                        # Markers dim when not highlighted
-                        attr = curses.color_pair(0) | curses.A_DIM
-                    else:
-                        attr = curses.A_DIM
-                    
-                    try:
-                        win.addstr(start_y + display_idx, indicator_x, display_char, attr)
-                    except curses.error:
-                        pass
-                        
-            # Scroll indicators
-            indicators = []
-            if len(self.preview_lines) > preview_h:
-                # Recalculate max_scroll to ensure it's current (adding 1 for final border)
-                current_max_scroll = max(0, len(self.preview_lines) - preview_h + 1)
-                # Calculate percentage based on scroll position
-                scroll_pct = int((self.preview_scroll / current_max_scroll) * 100) if current_max_scroll > 0 else 100
-                indicators.append(f"[{scroll_pct}%] PgUp/PgDn")
-            if max_h_scroll > 0:
-                indicators.append(f"←/→")
+                # Also check if last highlighted character is visible
+                if last_visible_display >= self.text_indicator_scroll + available_indicator_height:
+                    # Scroll to show last highlighted character with some context
+                    self.text_indicator_scroll = max(0, last_visible_display - available_indicator_height + 1)
+                
+                # Clamp scroll to valid range
+                max_scroll = max(0, len(display_text) - available_indicator_height)
+                self.text_indicator_scroll = max(0, min(self.text_indicator_scroll, max_scroll))
             
-            if indicators:
-                scroll_info = " " + " ".join(indicators) + " "
+            # Draw the letters in view dimmed, one per line, then highlight the ones
+            # visible in the preview
+            start_y = 2
+            scroll = self.text_indicator_scroll
+            visible = display_text[scroll:scroll + available_indicator_height]
+            for y, char in enumerate(visible, start_y):
                 try:
-                    win.addstr(h - 2, w - len(scroll_info) - 2, scroll_info, curses.color_pair(3))
+                    win.addstr(y, indicator_x, char, curses.A_DIM)
                 except curses.error:
                     pass
-        else:
-            msg = "No preview available"
-            win.addstr(h // 2, (w - len(msg)) // 2, msg, curses.A_DIM)
-            
-        win.refresh()
+            for char_idx in range(max(first_visible_display, scroll), min(last_visible_display + 1, scroll + len(visible))):
+                try:
+                    win.chgat(start_y + char_idx - scroll, indicator_x, 1, curses.color_pair(4) | curses.A_BOLD)
+                except curses.error:
+                    pass
+    
+    def _get_letter_starts(self, n: int) -> List[int]:
+        """First preview line of each of the n letters (plus the end), spread evenly over the content"""
+        key = (self.content_start_line, self.content_end_line, n)
+        if self._letter_starts_key != key:
+            start = self.content_start_line
+            content_height = self.content_end_line - start + 1
+            # Letter i starts on the first line at or past i * content_height / n (exact ceiling)
+            self._letter_starts = [start + -(-i * content_height // n) for i in range(n + 1)]
+            self._letter_starts_key = key
+        return self._letter_starts
+    
+    def _draw_scroll_info(self, win, h: int, w: int, preview_h: int, max_h_scroll: int):
+        """Draw the scroll position / scroll key hints at the bottom of the preview"""
+        indicators = []
+        if self._preview_line_count > preview_h:
+            # Recalculate max_scroll to ensure it's current (adding 1 for final border)
+            current_max_scroll = max(0, self._preview_line_count - preview_h + 1)
+            # Calculate percentage based on scroll position
+            scroll_pct = int((self.preview_scroll / current_max_scroll) * 100) if current_max_scroll > 0 else 100
+            indicators.append(f"[{scroll_pct}%] PgUp/PgDn")
+        if max_h_scroll > 0:
+            indicators.append(f"←/→")
         
+        if indicators:
+            scroll_info = " " + " ".join(indicators) + " "
+            try:
+                win.addstr(h - 2, w - len(scroll_info) - 2, scroll_info, curses.color_pair(3))
+            except curses.error:
+                pass
+    
     def draw_message(self, win, w: int):
         """Draw status message at bottom"""
         if self.message:
@@ -636,17 +831,23 @@ class BannerTUI:
                 win.addstr(0, (w - len(msg)) // 2, msg, curses.color_pair(3) | curses.A_BOLD)
             except curses.error:
                 pass
-            win.refresh()
             
     def handle_input(self, key):
         """Handle keyboard input"""
-        self.message = ""
+        if self.message:
+            self.message = ""
+            self._dirty["msg"] = True
+        
+        if key in (curses.KEY_LEFT, curses.KEY_RIGHT, curses.KEY_PPAGE, curses.KEY_NPAGE, 15, 16):
+            # These act on the preview, so it has to match the selection first
+            self._flush_preview()
         
         if key == 27:  # ESC key
             return False
             
         elif key == ord('\t'):  # TAB
             self.mode = "custom" if self.mode == "birthday" else "birthday"
+            self._dirty["left"] = True
             self.update_preview()
             
         elif key == curses.KEY_UP:
@@ -655,6 +856,7 @@ class BannerTUI:
                 # Adjust scroll to keep selection visible
                 if self.selected_idx < self.birthday_scroll:
                     self.birthday_scroll = self.selected_idx
+                self._dirty["left"] = True
                 self.update_preview()
                 
         elif key == curses.KEY_DOWN:
@@ -663,45 +865,52 @@ class BannerTUI:
                 # Adjust scroll to keep selection visible using actual calculated height
                 if self.selected_idx >= self.birthday_scroll + self.birthday_visible_height:
                     self.birthday_scroll = self.selected_idx - self.birthday_visible_height + 1
+                self._dirty["left"] = True
                 self.update_preview()
                 
         elif key == curses.KEY_LEFT:
             # Scroll preview left
             if self.preview_lines:
                 self.preview_h_scroll = max(0, self.preview_h_scroll - 5)
+                self._dirty["right"] = True
                 
         elif key == curses.KEY_RIGHT:
             # Scroll preview right
             if self.preview_lines:
                 self.preview_h_scroll += 5
+                self._dirty["right"] = True
                 
         elif key == curses.KEY_PPAGE:  # Page Up - scroll preview in all modes
             if self.preview_lines:
                 self.preview_scroll = max(0, self.preview_scroll - 10)
+                self._dirty["right"] = True
                 
         elif key == curses.KEY_NPAGE:  # Page Down - scroll preview in all modes
             if self.preview_lines:
-                # Calculate proper max scroll based on current window size
-                h, w = self.stdscr.getmaxyx()
-                preview_h = h - 1 - 4  # Account for window borders and status
-                max_scroll = max(0, len(self.preview_lines) - preview_h + 1)
+                # Max scroll from the cached line count and the layout of the last resize
+                max_scroll = max(0, self._preview_line_count - self._layout.preview_h + 1)
                 self.preview_scroll = min(max_scroll, self.preview_scroll + 10)
+                self._dirty["right"] = True
                 
         elif self.mode == "custom":
             # Handle text input in custom mode FIRST (before print check)
             if key == curses.KEY_BACKSPACE or key == 127:
-                if self.custom_text:
-                    self.custom_text = self.custom_text[:-1]
-                    self.update_preview()
+                if self._custom_buf:
+                    del self._custom_buf[-1:]
+                    self._dirty["left"] = True
+                    self._defer_preview()
             elif key == curses.KEY_DC:  # Delete key
-                self.custom_text = ""
-                self.update_preview()
+                self._custom_buf.clear()
+                self._dirty["left"] = True
+                self._defer_preview()
             elif 32 <= key <= 126:  # Printable characters (including p/P)
-                if len(self.custom_text) < 50:  # Limit length
-                    self.custom_text += chr(key)
-                    self.update_preview()
+                if len(self._custom_buf) < 50:  # Limit length
+                    self._custom_buf.append(key)
+                    self._dirty["left"] = True
+                    self._defer_preview()
                     
         elif key == 16:  # Ctrl+P (works in both modes)
+            self._dirty["msg"] = True
             text = self.get_current_text()
             if text and self.preview_lines:
                 try:
@@ -720,56 +929,97 @@ class BannerTUI:
                     
         return True
         
+    def _place_windows(self, layout: Layout):
+        """Create the panel windows, or resize and move the existing ones to fit the terminal"""
+        geometry = ((layout.panel_h, layout.left_w, 0, 0),
+                    (layout.panel_h, layout.right_w, 0, layout.left_w),
+                    (1, layout.w, layout.h - 1, 0))
+        if not self._panels:
+            self._panels = [curses.panel.new_panel(curses.newwin(*g)) for g in geometry]
+        else:
+            for panel, (ph, pw, y, x) in zip(self._panels, geometry):
+                try:
+                    panel.window().resize(ph, pw)
+                    panel.move(y, x)
+                except curses.error:
+                    panel.replace(curses.newwin(ph, pw, y, x))  # e.g. a degenerate size
+        self.left_win, self.right_win, self.msg_win = (panel.window() for panel in self._panels)
+        
     def run(self):
         """Main TUI loop"""
         # # Set background and clear
         self.stdscr.bkgd(' ', curses.A_NORMAL)
         self.stdscr.clear()
-        self.stdscr.refresh()
+        self.stdscr.noutrefresh()  # The clear goes out with the first frame, in one doupdate
         
         # Draw the initial display before waiting for any input
-        h, w = self.stdscr.getmaxyx()
-        left_w = min(40, w // 3)
-        right_w = w - left_w - 1
-        
-        left_win = curses.newwin(h - 1, left_w, 0, 0)
-        right_win = curses.newwin(h - 1, right_w, 0, left_w)
-        msg_win = curses.newwin(1, w, h - 1, 0)
+        layout = self._refresh_layout()
+        self._place_windows(layout)
         
-        self.draw_left_panel(left_win, h - 1, left_w)
-        self.draw_right_panel(right_win, h - 1, right_w)
-        self.draw_message(msg_win, w)
+        self.draw_left_panel(self.left_win, layout)
+        self.draw_right_panel(self.right_win, layout)
+        self.draw_message(self.msg_win, layout.w)
+        curses.panel.update_panels()
+        curses.doupdate()
+        self._dirty.update(left=False, right=False, msg=False)
         
-        # self.stdscr.nodelay(True)  # Non-blocking mode - keeps display visible
-                
         while True:
-            # Get input
+            # Get input, waking up when typing pauses
+            if self._preview_wanted:
+                # Never block while a preview is owed: a slow frame can use up the whole pause
+                self.stdscr.timeout(max(1, self._debounce_ms()))
+            else:
+                self.stdscr.timeout(-1)
             key = self.stdscr.getch()
+            keys = [key]
             
-            # Small sleep to avoid CPU spinning when no input
             if key == -1:
-                time.sleep(0.05)
-                continue
-            
-            if not self.handle_input(key):
-                break
-            
-            # Redraw after handling input
-            h, w = self.stdscr.getmaxyx()
-            
-            # Calculate panel sizes
-            left_w = min(40, w // 3)
-            right_w = w - left_w - 1
+                # Timed out: show the preview for the text typed so far
+                if not self._debounce_ms():
+                    self._flush_preview()
+            else:
+                # Collect any keys queued behind this one (e.g. a held arrow key) and apply them
+                # all before drawing once. Stop at keys that read further input themselves
+                self.stdscr.timeout(0)
+                while len(keys) < KEY_BATCH_MAX and keys[-1] not in (27, 15, curses.KEY_RESIZE):
+                    queued = self.stdscr.getch()
+                    if queued == -1:
+                        break
+                    keys.append(queued)
+                
+                self._batching = True
+                running = all(self.handle_input(k) for k in keys)
+                self._batching = False
+                if not running:
+                    break
+                if not self._debounce_ms():
+                    self._flush_preview()
             
-            # Create windows
-            left_win = curses.newwin(h - 1, left_w, 0, 0)
-            right_win = curses.newwin(h - 1, right_w, 0, left_w)
-            msg_win = curses.newwin(1, w, h - 1, 0)
+            # Recompute the layout only when the terminal may have been resized, and
+            # recreate windows only when it actually was
+            if curses.KEY_RESIZE in keys or self._layout_stale:
+                self._layout_stale = False
+                self._dirty.update(left=True, right=True, msg=True)
+                old_size = (layout.h, layout.w)
+                layout = self._refresh_layout()
+                if (layout.h, layout.w) != old_size:
+                    self._place_windows(layout)
             
-            # Draw panels
-            self.draw_left_panel(left_win, h - 1, left_w)
-            self.draw_right_panel(right_win, h - 1, right_w)
-            self.draw_message(msg_win, w)
+            # Draw only the panels whose contents changed; update_panels then pushes just
+            # the changed cells, and doupdate sends them to the terminal in one go
+            if any(self._dirty.values()):
+                if self._dirty["left"]:
+                    self._dirty["left"] = False
+                    self.draw_left_panel(self.left_win, layout)
+                if self._dirty["right"]:
+                    self._dirty["right"] = False
+                    self.draw_right_panel(self.right_win, layout)
+                if self._dirty["msg"]:
+                    self._dirty["msg"] = False
+                    self.draw_message(self.msg_win, layout.w)
+                curses.panel.update_panels()
+                curses.doupdate()
+
 
 def main():
     """Entry point"""
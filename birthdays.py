@@ -1,34 +1,140 @@
 #!/usr/bin/env python3
+import calendar
 import csv
+import io
+import os
+import re
 import sys
 import datetime
+from functools import lru_cache
 
 # Import from banner.py (must be in same directory or PYTHONPATH)
 from banner import banner_lines, send_to_lpr
 
 DEFAULT_CSV = "birthdays.csv"
-
+CSV_BUFFER_SIZE = 1 << 20  # Read the CSV in 1 MiB chunks rather than the default 8 KiB
+
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%m/%d/%y",
+    "%B %d, %Y",
+    "%b %d, %Y",
+    "%m-%d-%Y",
+    "%m-%d-%y",
+)
+NAME_FORMATS = tuple(fmt for fmt in DATE_FORMATS if fmt.startswith(("%B", "%b")))
+NUMERIC_FORMATS = tuple(fmt for fmt in DATE_FORMATS if fmt not in NAME_FORMATS)
+
+# One pattern covering the shapes in DATE_FORMATS: ISO, numeric month-day-year with
+# / or -, and month name, day, year. Anything it misses falls back to strptime.
+DATE_RE = re.compile(r"""
+    (?P<iso_y>\d{4})-(?P<iso_m>\d{1,2})-(?P<iso_d>\d{1,2})
+  | (?P<num_m>\d{1,2})(?P<sep>[/-])(?P<num_d>\d{1,2})(?P=sep)(?P<num_y>\d{4}|\d{2})
+  | (?P<name_m>[a-z]+)\s+(?P<name_d>\d{1,2}),\s+(?P<name_y>\d{4})
+""", re.ASCII | re.IGNORECASE | re.VERBOSE)
+MONTHS = {name.lower(): i for names in (calendar.month_name, calendar.month_abbr)
+          for i, name in enumerate(names) if name}
+
+@lru_cache(maxsize=4096)
 def parse_date(date_str):
     """
-    Parse common date formats; only month/day matter.
+    Parse common date formats into a date, or None; only month/day matter.
+    Shared with banner_studio.py.
     """
     date_str = date_str.strip()
-    fmts = [
-        "%Y-%m-%d",
-        "%m/%d/%Y",
-        "%m/%d/%y",
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%m-%d-%Y",
-        "%m-%d-%y",
-    ]
-    for fmt in fmts:
+
+    m = DATE_RE.fullmatch(date_str)
+    if m:
+        try:
+            return _date_from_match(m)
+        except (KeyError, ValueError):
+            pass  # not a real date (or month name); let strptime decide
+
+    for fmt in _candidate_formats(date_str):
         try:
-            return datetime.datetime.strptime(date_str, fmt)
+            return datetime.datetime.strptime(date_str, fmt).date()
         except ValueError:
             pass
     return None
 
+def _candidate_formats(date_str):
+    """
+    The DATE_FORMATS that could match date_str, judged from its first few characters.
+    """
+    head = date_str[:1]
+    if head.isalpha():
+        return NAME_FORMATS
+    if not head.isdigit():
+        return ()  # every format starts with a number or a month name
+    if date_str[:4].isdigit() and date_str[4:5] == "-":
+        return ("%Y-%m-%d",)
+    # A numeric month is at most two digits, so its separator is within the first three
+    if "/" in date_str[:3]:
+        return ("%m/%d/%Y", "%m/%d/%y")
+    if "-" in date_str[:3]:
+        return ("%m-%d-%Y", "%m-%d-%y")
+    return NUMERIC_FORMATS
+
+def _date_from_match(m):
+    """
+    date for a DATE_RE match, with strptime's %y rule for two-digit years.
+    """
+    if m.group("iso_y"):
+        return datetime.date(int(m.group("iso_y")), int(m.group("iso_m")), int(m.group("iso_d")))
+    if m.group("num_y"):
+        year = int(m.group("num_y"))
+        if len(m.group("num_y")) == 2:
+            year += 2000 if year <= 68 else 1900
+        return datetime.date(year, int(m.group("num_m")), int(m.group("num_d")))
+    month = MONTHS[m.group("name_m").lower()]
+    return datetime.date(int(m.group("name_y")), month, int(m.group("name_d")))
+
+def _column(header, name):
+    """
+    Index of the named column, or None if the file doesn't have it.
+    """
+    return header.index(name) if name in header else None
+
+def _field(row, idx):
+    """
+    Stripped value of column idx; a missing column or short row reads as empty.
+    """
+    return row[idx].strip() if idx is not None and idx < len(row) else ""
+
+def _is_today(dob_str, today, day_token, month_tokens):
+    """
+    True if dob_str is a date falling on today's month and day.
+    """
+    if not dob_str:
+        return False
+
+    # Every supported format spells out the day digits and either the month digits or
+    # the month name, so a string missing them can't be a birthday today
+    dob_key = dob_str.lower()
+    if day_token not in dob_key or not any(t in dob_key for t in month_tokens):
+        return False
+
+    dob = parse_date(dob_str)
+    return bool(dob) and dob.month == today.month and dob.day == today.day
+
+def _make_banner(name):
+    """
+    Birthday banner lines for name.
+    """
+    message = f"Happy Birthday {name}!"
+
+    # Create banner text → returns list of strings
+    return banner_lines(message,
+                        page_lines=66,
+                        page_cols=80,
+                        rotate="cw",
+                        h_space=1,
+                        zoom=0,       # auto-zoom allowed
+                        #margin=5,
+                        #side_margin_cols=5
+                        )
+
 def preview(lines):
     pages = 1
     print("+" + "-"*80 + "+")
@@ -44,54 +150,61 @@ def main():
     csv_file = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CSV
 
     today = datetime.date.today()
-    today_month = today.month
-    today_day = today.day
+    day_token = str(today.day)
+    month_tokens = (str(today.month), today.strftime("%b").lower())
+    names = []  # Whose birthday it is, in file order
 
     try:
-        with open(csv_file, newline='', encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                first = row.get("First Name", "").strip()
-                alias = row.get("Alias", "").strip()
-                dob_str = row.get("Date of Birth", "").strip()
-
-                if not dob_str:
+        with open(csv_file, "rb", buffering=CSV_BUFFER_SIZE) as raw:
+            if hasattr(os, "posix_fadvise"):
+                try:
+                    # The file is read once, front to back: let the kernel read ahead aggressively
+                    os.posix_fadvise(raw.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass  # e.g. a pipe
+            f = io.TextIOWrapper(raw, encoding="utf-8", newline='')
+            reader = csv.reader(f)
+            header = next(reader, [])
+            idx_first = _column(header, "First Name")
+            idx_alias = _column(header, "Alias")
+            idx_dob = _column(header, "Date of Birth")
+
+            rows = list(reader)
+
+        # Column-wise, like a dataframe: decide each distinct date string once, then
+        # pick out the rows whose date is one of today's
+        dobs = [_field(row, idx_dob) for row in rows]
+        todays_dobs = {dob_str for dob_str in set(dobs)
+                       if _is_today(dob_str, today, day_token, month_tokens)}
+
+        for row, dob_str in zip(rows, dobs):
+            if dob_str in todays_dobs:
+                first = _field(row, idx_first)
+                alias = _field(row, idx_alias)
+                name = alias if alias else first
+                if not name:
                     continue
 
-                dob = parse_date(dob_str)
-                if not dob:
-                    continue
-
-                if dob.month == today_month and dob.day == today_day:
-                    name = alias if alias else first
-                    if not name:
-                        continue
-
-                    message = f"Happy Birthday {name}!"
-
-                    # Create banner text → returns list of strings
-                    lines = banner_lines(message,
-                                         page_lines=66,
-                                         page_cols=80,
-                                         rotate="cw",
-                                         h_space=1,
-                                         zoom=0,       # auto-zoom allowed
-                                         #margin=5,
-                                         #side_margin_cols=5
-                                         )
-
-                    # Print to default printer
-                    if ("--preview" in sys.argv):
-                        preview(lines)
-                    elif ("--print" in sys.argv or "--printer" in sys.argv):
-                        send_to_lpr(lines)
-                        print(f"Printed birthday banner for: {name}")
-                    else:
-                        for line in lines:
-                            print(line)
-                    
-
+                names.append(name)
+
+        # Render every banner before printing any
+        banners = [_make_banner(name) for name in names]
+
+        # Print to default printer, as one job: every banner is a whole number of
+        # 66-line pages, so each one already starts at the top of a page
+        if ("--print" in sys.argv or "--printer" in sys.argv) and "--preview" not in sys.argv:
+            if banners:
+                send_to_lpr([line for lines in banners for line in lines])
+            for name in names:
+                print(f"Printed birthday banner for: {name}")
+            return
+
+        for lines in banners:
+            if ("--preview" in sys.argv):
+                preview(lines)
+            else:
+                for line in lines:
+                    print(line)
 
     except FileNotFoundError:
         print(f"Error: Could not open file: {csv_file}")